@@ -1,8 +1,10 @@
 import asyncio
+import functools
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp import Tool
 import stravalib
+import orjson
 import os
 from dotenv import load_dotenv
 
@@ -10,8 +12,19 @@ load_dotenv()
 app = Server("strava-mcp")
 
 
-def _strava_client():
-    return stravalib.Client(access_token=os.getenv("STRAVA_ACCESS_TOKEN"))
+STRAVA_ACCESS_TOKEN = os.getenv("STRAVA_ACCESS_TOKEN")
+if not STRAVA_ACCESS_TOKEN:
+    raise ValueError("STRAVA_ACCESS_TOKEN is not set")
+
+# One client per process so its HTTP session (and keep-alive connection
+# to www.strava.com) is reused across tool calls.
+_client = stravalib.Client(access_token=STRAVA_ACCESS_TOKEN)
+
+
+@functools.cache
+def _athlete_id():
+    # The token belongs to a single athlete, so look the id up only once.
+    return _client.get_athlete().id
 
 
 @app.list_tools()
@@ -19,11 +32,21 @@ async def list_tools():
     return [
         Tool(
             name="get_strava_activities",
-            description="List recent Strava activities",
+            description=(
+                "List Strava activities. Without 'after', returns the most recent ones, newest first. "
+                "With 'after', returns the first 'limit' activities after that date, oldest first"
+            ),
             inputSchema={
                 "type": "object",
                 "properties": {
                     "limit": {"type": "integer", "default": 10},
+                    "after": {
+                        "type": "string",
+                        "description": (
+                            "ISO 8601 date or datetime, e.g. 2024-01-31 (a date alone is read as UTC midnight). "
+                            "Returns the first 'limit' activities after this date, oldest first"
+                        ),
+                    },
                 },
             },
         ),
@@ -58,6 +81,12 @@ async def list_tools():
                         "items": {"type": "string"},
                         "default": ["heartrate", "velocity_smooth", "cadence", "altitude", "watts"],
                     },
+                    "resolution": {
+                        "type": "string",
+                        "enum": ["low", "medium", "high"],
+                        "default": "medium",
+                        "description": "Sample density; use low for overviews to keep the payload small",
+                    },
                 },
                 "required": ["activity_id"],
             },
@@ -67,12 +96,23 @@ async def list_tools():
 
 @app.call_tool()
 async def call_tool(name, arguments):
+    # stravalib is blocking; run it in a worker thread so the stdio
+    # transport keeps serving other requests while Strava responds.
+    # Concurrent calls share _client (one requests.Session plus its rate
+    # limiter) across threads. requests does not promise Session is
+    # thread-safe, but the underlying urllib3 pool is, and these calls
+    # only issue GETs without touching session state.
+    return await asyncio.to_thread(_call_tool, name, arguments)
+
+
+def _call_tool(name, arguments):
     if name == "get_strava_activities":
-        client = _strava_client()
-        activities = client.get_activities(limit=arguments.get("limit", 10))
-        result = []
-        for a in activities:
-            result.append({
+        activities = _client.get_activities(
+            after=arguments.get("after"),
+            limit=arguments.get("limit", 10),
+        )
+        result = [
+            {
                 "id": a.id,
                 "name": a.name,
                 "type": str(a.sport_type),
@@ -85,12 +125,13 @@ async def call_tool(name, arguments):
                 "avg_watts": a.average_watts,
                 "avg_cadence": a.average_cadence,
                 "calories": getattr(a, "calories", None),
-            })
-        return [{"type": "text", "text": str(result)}]
+            }
+            for a in activities
+        ]
+        return [{"type": "text", "text": orjson.dumps(result, default=str).decode()}]
 
     elif name == "get_strava_activity":
-        client = _strava_client()
-        a = client.get_activity(arguments["activity_id"])
+        a = _client.get_activity(arguments["activity_id"])
         detail = {
             "id": a.id,
             "name": a.name,
@@ -123,12 +164,10 @@ async def call_tool(name, arguments):
                 }
                 for i, lap in enumerate(a.laps)
             ]
-        return [{"type": "text", "text": str(detail)}]
+        return [{"type": "text", "text": orjson.dumps(detail, default=str).decode()}]
 
     elif name == "get_strava_athlete_stats":
-        client = _strava_client()
-        athlete = client.get_athlete()
-        stats = client.get_athlete_stats(athlete.id)
+        stats = _client.get_athlete_stats(_athlete_id())
 
         def totals(t):
             if t is None:
@@ -151,18 +190,18 @@ async def call_tool(name, arguments):
             "all_ride": totals(stats.all_ride_totals),
             "all_swim": totals(stats.all_swim_totals),
         }
-        return [{"type": "text", "text": str(result)}]
+        return [{"type": "text", "text": orjson.dumps(result, default=str).decode()}]
 
     elif name == "get_strava_streams":
-        client = _strava_client()
         types = arguments.get("types", ["heartrate", "velocity_smooth", "cadence", "altitude", "watts"])
-        streams = client.get_activity_streams(
+        streams = _client.get_activity_streams(
             arguments["activity_id"],
             types=types,
-            resolution="medium",
+            resolution=arguments.get("resolution", "medium"),
         )
         result = {key: stream.data for key, stream in streams.items()}
-        return [{"type": "text", "text": str(result)}]
+        # Compact output: streams can hold thousands of samples per series.
+        return [{"type": "text", "text": orjson.dumps(result, default=str).decode()}]
 
 
 if __name__ == "__main__":
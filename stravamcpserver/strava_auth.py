@@ -1,23 +1,19 @@
 import webbrowser
 import urllib.parse
-from http.server import HTTPServer, BaseHTTPRequestHandler
-import requests
+import urllib.request
+import json
+import socket
 import os
 
 CLIENT_ID = os.environ.get("STRAVA_CLIENT_ID", "")
 CLIENT_SECRET = os.environ.get("STRAVA_CLIENT_SECRET", "")
 REDIRECT_URI = "http://localhost:8080/callback"
 
-auth_code = None
-
-class CallbackHandler(BaseHTTPRequestHandler):
-    def do_GET(self):
-        global auth_code
-        params = urllib.parse.parse_qs(urllib.parse.urlparse(self.path).query)
-        auth_code = params.get("code", [None])[0]
-        self.send_response(200)
-        self.end_headers()
-        self.wfile.write(b"OK - tu peux fermer cette fenetre")
+# Écoute le callback avant d'ouvrir le navigateur
+server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+server.bind(("localhost", 8080))
+server.listen(1)
 
 # Ouvre le navigateur pour l'autorisation
 url = (f"https://www.strava.com/oauth/authorize?client_id={CLIENT_ID}"
@@ -25,17 +21,39 @@ url = (f"https://www.strava.com/oauth/authorize?client_id={CLIENT_ID}"
        f"&scope=activity:read_all")
 webbrowser.open(url)
 
-# Attend le callback
-server = HTTPServer(("localhost", 8080), CallbackHandler)
-server.handle_request()  # une seule requête puis on stoppe
+# Attend le callback : une seule requête puis on stoppe
+conn, _ = server.accept()
+data = b""
+while b"\r\n\r\n" not in data:
+    chunk = conn.recv(4096)
+    if not chunk:
+        break
+    data += chunk
+parts = data.split(b"\r\n", 1)[0].split(b" ")
+path = parts[1].decode() if len(parts) > 1 else ""
+params = urllib.parse.parse_qs(urllib.parse.urlparse(path).query)
+auth_code = params.get("code", [None])[0]
+if auth_code:
+    status, reply = b"200 OK", b"OK - tu peux fermer cette fenetre"
+else:
+    status, reply = b"400 Bad Request", b"Pas de code d'autorisation dans la requete"
+conn.sendall(b"HTTP/1.1 %s\r\nContent-Length: %d\r\nConnection: close\r\n\r\n%s" % (status, len(reply), reply))
+conn.close()
+server.close()
+
+if not auth_code:
+    error = params.get("error", ["requête de callback invalide"])[0]
+    raise SystemExit(f"Pas de code d'autorisation reçu sur {REDIRECT_URI} : {error}")
 
 # Échange le code contre les tokens
-resp = requests.post("https://www.strava.com/oauth/token", data={
+body = urllib.parse.urlencode({
     "client_id": CLIENT_ID,
     "client_secret": CLIENT_SECRET,
     "code": auth_code,
     "grant_type": "authorization_code",
-})
-tokens = resp.json()
+}).encode()
+req = urllib.request.Request("https://www.strava.com/oauth/token", data=body, method="POST")
+with urllib.request.urlopen(req) as resp:
+    tokens = json.load(resp)
 print("Access token :", tokens["access_token"])
 print("Refresh token:", tokens["refresh_token"])  # ← sauvegarde celui-ci !